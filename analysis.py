@@ -0,0 +1,193 @@
+# Pełna analiza drzewa gry i księga otwarć zapisywana na dysku (mmap)
+import argparse
+import mmap
+import os
+import struct
+import sys
+from array import array
+
+import rules
+
+BOOK_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "opening_book.bin")
+BOOK_MAGIC = 0x4B494B42  # "KIKB" zapisane w natywnej kolejności bajtów
+BOOK_VERSION = 1
+HEADER = struct.Struct("=IHHI")  # magic, wersja, rozmiar planszy, liczba pozycji kanonicznych
+TABLE_SIZE = 3 ** 9
+
+# Wartości z perspektywy gracza na ruchu; 0 w tabeli oznacza pozycję nieosiągalną lub niekanoniczną
+UNKNOWN, LOSS, DRAW, WIN = 0, 1, 2, 3
+VALUE_NAMES = {LOSS: "przegrana", DRAW: "remis", WIN: "wygrana"}
+ACCURATE, MISTAKE, BLUNDER = "accurate", "mistake", "blunder"
+
+
+def _symmetries():
+    # 8 symetrii planszy jako permutacje indeksów: canonical[i] = board[perm[i]]
+    def rotate(p): return [p[(2 - c) * 3 + r] for r in range(3) for c in range(3)]
+
+    def mirror(p): return [p[r * 3 + (2 - c)] for r in range(3) for c in range(3)]
+
+    perms, p = [], list(range(9))
+    for _ in range(4):
+        perms.append(p); perms.append(mirror(p)); p = rotate(p)
+    return [tuple(p) for p in perms]
+
+
+SYMMETRIES = _symmetries()
+POWERS = tuple(3 ** i for i in range(9))
+
+
+def _encode(cells):
+    return sum(d * POWERS[i] for i, d in enumerate(cells))
+
+
+def canonicalize(cells):
+    # cells: 9 cyfr (0 puste, 1 gracz na ruchu, 2 przeciwnik); zwraca (kod kanoniczny, użyta permutacja)
+    return min((_encode([cells[j] for j in perm]), perm) for perm in SYMMETRIES)
+
+
+def _to_cells(board, mark):
+    return [0 if board[r][c] == "" else (1 if board[r][c] == mark else 2) for r in range(3) for c in range(3)]
+
+
+def _to_board(cells):
+    return [["" if cells[r * 3 + c] == 0 else ("X" if cells[r * 3 + c] == 1 else "O") for c in range(3)]
+            for r in range(3)]
+
+
+def _is_terminal(cells):
+    board = _to_board(cells)
+    if rules.get_winner_info(board, "O"): return LOSS  # przeciwnik właśnie wygrał
+    if rules.is_board_full(board): return DRAW
+    return None
+
+
+def build_table():
+    # Rekord: bity 0-17 to wartości ruchów (2 bity na pole, UNKNOWN = pole zajęte), bity 18-19 to wartość pozycji
+    table = array("I", [0]) * TABLE_SIZE
+
+    def solve(cells):
+        code, perm = canonicalize(cells)
+        if table[code]: return table[code] >> 18
+        cells = [cells[j] for j in perm]
+        terminal = _is_terminal(cells)
+        if terminal is not None:
+            table[code] = terminal << 18
+            return terminal
+        record, best = 0, LOSS
+        for i in range(9):
+            if cells[i] != 0: continue
+            # Po ruchu zamieniamy kolory, żeby na ruchu zawsze był gracz "1"
+            child = [0 if d == 0 else 3 - d for d in cells]
+            child[i] = 2
+            move_value = WIN + LOSS - solve(child)
+            record |= move_value << (2 * i)
+            best = max(best, move_value)
+        table[code] = record | (best << 18)
+        return best
+
+    solve([0] * 9)
+    return table
+
+
+def write_book(path=BOOK_PATH):
+    table = build_table()
+    positions = sum(1 for record in table if record)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(BOOK_MAGIC, BOOK_VERSION, rules.BOARD_SIZE, positions))
+        table.tofile(f)
+    os.replace(tmp_path, path)
+    return positions
+
+
+class OpeningBook:
+    def __init__(self, path=BOOK_PATH):
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mmap) != HEADER.size + TABLE_SIZE * 4:
+            self._mmap.close()
+            raise ValueError(f"Niepoprawny rozmiar pliku księgi otwarć: {path}")
+        magic, version, size, self.positions = HEADER.unpack_from(self._mmap, 0)
+        if magic != BOOK_MAGIC or version != BOOK_VERSION or size != rules.BOARD_SIZE:
+            self._mmap.close()
+            raise ValueError(f"Niepoprawny plik księgi otwarć: {path}")
+        self._table = memoryview(self._mmap)[HEADER.size:HEADER.size + TABLE_SIZE * 4].cast("I")
+
+    @classmethod
+    def load_or_build(cls, path=BOOK_PATH):
+        try:
+            return cls(path)
+        except (OSError, ValueError):
+            print(f"[Analiza] Generowanie księgi otwarć: {path}")
+            write_book(path)
+            return cls(path)
+
+    def close(self):
+        self._table.release()
+        self._mmap.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def lookup(self, board, mark):
+        # Zwraca (wartość pozycji, {(r, c): wartość ruchu}) z perspektywy gracza mark
+        code, perm = canonicalize(_to_cells(board, mark))
+        record = self._table[code]
+        if not record: raise KeyError("Pozycja nieosiągalna w grze")
+        moves = {}
+        for i in range(9):
+            move_value = (record >> (2 * i)) & 3
+            if move_value: moves[divmod(perm[i], 3)] = move_value
+        return record >> 18, moves
+
+    def best_moves(self, board, mark):
+        value, moves = self.lookup(board, mark)
+        return [move for move, move_value in moves.items() if move_value == value]
+
+    def classify_move(self, board, mark, r, c):
+        # Ocena ruchu do analizy po grze; board to stan sprzed ruchu
+        value, moves = self.lookup(board, mark)
+        if (r, c) not in moves: raise ValueError(f"Niedozwolony ruch: {r}, {c}")
+        if moves[(r, c)] == value: return ACCURATE
+        return BLUNDER if moves[(r, c)] == LOSS else MISTAKE
+
+
+def _parse_board(text):
+    if len(text) != 9 or any(ch not in "XO." for ch in text): raise ValueError("Plansza to 9 znaków z 'XO.'")
+    return [[("" if ch == "." else ch) for ch in text[r * 3:r * 3 + 3]] for r in range(3)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analiza drzewa gry Kółko i Krzyżyk i księga otwarć.")
+    parser.add_argument("--book", default=BOOK_PATH, help="Ścieżka pliku księgi otwarć")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("build", help="Wygeneruj księgę otwarć")
+    show = sub.add_parser("show", help="Pokaż ocenę pozycji")
+    show.add_argument("board", help="9 znaków wiersz po wierszu, np. X...O....")
+    show.add_argument("mark", choices=rules.MARKS, help="Gracz na ruchu")
+    args = parser.parse_args()
+
+    if args.command == "build":
+        positions = write_book(args.book)
+        print(f"[Analiza] Zapisano {positions} pozycji kanonicznych do {args.book}.")
+        return
+    try:
+        board = _parse_board(args.board)
+    except ValueError as e:
+        parser.error(str(e))
+    with OpeningBook.load_or_build(args.book) as book:
+        try:
+            value, moves = book.lookup(board, args.mark)
+        except KeyError as e:
+            print(f"[Analiza] {e.args[0]}"); sys.exit(1)
+        print(f"[Analiza] Ocena dla {args.mark}: {VALUE_NAMES[value]}")
+        for (r, c), move_value in sorted(moves.items()):
+            marker = " *" if move_value == value else ""
+            print(f"  ruch ({r}, {c}): {VALUE_NAMES[move_value]}{marker}")
+
+
+if __name__ == "__main__":
+    main()
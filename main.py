@@ -5,6 +5,8 @@ import random
 import time
 import math
 
+import rules
+
 BUFFER_SIZE = 1024
 AVAILABLE_PLAYER_COLORS = ["#E74C3C", "#3498DB", "#2ECC71", "#F1C40F", "#9B59B6", "#E67E22", "#1ABC9C", "#FF69B4",
                            "#7D3C98"]
@@ -246,12 +248,7 @@ class TicTacToeNetworkGame:
             print(f"[{self.debug_id}] Gra kontynuowana. Tura dla: {self.turn}.")
 
     def get_winner_info(self, mark):
-        for i in range(3):
-            if all(self.board[i][j] == mark for j in range(3)): return (mark, "row", i)
-            if all(self.board[j][i] == mark for j in range(3)): return (mark, "col", i)
-        if all(self.board[i][i] == mark for i in range(3)): return (mark, "diag", None)
-        if all(self.board[i][2 - i] == mark for i in range(3)): return (mark, "antidiag", None)
-        return None
+        return rules.get_winner_info(self.board, mark)
 
     def animate_winning_line(self, winner_info, color="#27AE60", steps=20, delay=15):
         self.canvas.delete("win_line_segment")
@@ -290,7 +287,7 @@ class TicTacToeNetworkGame:
             print(f"[{self.debug_id}] Efekt porażki (tekst) zastosowany.")
 
     def is_board_full(self):
-        return all(self.board[i][j] != "" for i in range(3) for j in range(3))
+        return rules.is_board_full(self.board)
 
     def reset_board(self):
         self.board = [["" for _ in range(3)] for _ in range(3)]
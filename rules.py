@@ -0,0 +1,58 @@
+# Zasady gry bez zależności od GUI - używane przez okno gry i tryb turniejowy
+BOARD_SIZE = 3
+MARKS = ("X", "O")
+
+
+def new_board():
+    return [["" for _ in range(BOARD_SIZE)] for _ in range(BOARD_SIZE)]
+
+
+def other_mark(mark):
+    return "O" if mark == "X" else "X"
+
+
+def get_winner_info(board, mark):
+    for i in range(3):
+        if all(board[i][j] == mark for j in range(3)): return (mark, "row", i)
+        if all(board[j][i] == mark for j in range(3)): return (mark, "col", i)
+    if all(board[i][i] == mark for i in range(3)): return (mark, "diag", None)
+    if all(board[i][2 - i] == mark for i in range(3)): return (mark, "antidiag", None)
+    return None
+
+
+def is_board_full(board):
+    return all(board[i][j] != "" for i in range(3) for j in range(3))
+
+
+def empty_cells(board):
+    return [(r, c) for r in range(3) for c in range(3) if board[r][c] == ""]
+
+
+class HeadlessGame:
+    # Odpowiednik TicTacToeNetworkGame bez okna, animacji i sieci
+    def __init__(self, first_turn="X"):
+        self.board = new_board()
+        self.turn = first_turn
+        self.game_over = False
+        self.winner = None  # "X", "O" albo None (remis / gra trwa)
+
+    def make_move(self, r, c, mark):
+        if self.game_over or mark != self.turn or not (0 <= r <= 2 and 0 <= c <= 2) or self.board[r][c] != "":
+            return False
+        self.board[r][c] = mark
+        self._check_game_state_after_move(mark)
+        return True
+
+    def _check_game_state_after_move(self, mark_just_placed):
+        if self.get_winner_info(mark_just_placed):
+            self.game_over = True; self.winner = mark_just_placed
+        elif self.is_board_full():
+            self.game_over = True
+        else:
+            self.turn = other_mark(mark_just_placed)
+
+    def get_winner_info(self, mark):
+        return get_winner_info(self.board, mark)
+
+    def is_board_full(self):
+        return is_board_full(self.board)
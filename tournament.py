@@ -0,0 +1,287 @@
+# Turniej botów bez GUI - gry rozgrywane równolegle w puli procesów
+import argparse
+import os
+import random
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache
+
+import rules
+
+BUFFER_SIZE = 1024
+DEFAULT_CHUNK_SIZE = 5000
+REMOTE_PREFIX = "remote:"
+
+
+# Strategie AI: (board, mark, rng) -> (r, c)
+def random_strategy(board, mark, rng):
+    return rng.choice(rules.empty_cells(board))
+
+
+def first_free_strategy(board, mark, rng):
+    return rules.empty_cells(board)[0]
+
+
+def center_first_strategy(board, mark, rng):
+    for r, c in ((1, 1), (0, 0), (0, 2), (2, 0), (2, 2), (0, 1), (1, 0), (1, 2), (2, 1)):
+        if board[r][c] == "": return (r, c)
+
+
+@lru_cache(maxsize=None)
+def _minimax_moves(key, mark):
+    # key: 9 znaków ("X", "O", ".") wiersz po wierszu; zwraca (wartość dla mark, najlepsze ruchy)
+    board = [[("" if ch == "." else ch) for ch in key[r * 3:r * 3 + 3]] for r in range(3)]
+    best_value, best_moves = -2, []
+    for r, c in rules.empty_cells(board):
+        board[r][c] = mark
+        if rules.get_winner_info(board, mark):
+            value = 1
+        elif rules.is_board_full(board):
+            value = 0
+        else:
+            value = -_minimax_moves(_board_key(board), rules.other_mark(mark))[0]
+        board[r][c] = ""
+        if value > best_value:
+            best_value, best_moves = value, [(r, c)]
+        elif value == best_value:
+            best_moves.append((r, c))
+    return best_value, tuple(best_moves)
+
+
+def _board_key(board):
+    return "".join(board[r][c] or "." for r in range(3) for c in range(3))
+
+
+def minimax_strategy(board, mark, rng):
+    return rng.choice(_minimax_moves(_board_key(board), mark)[1])
+
+
+STRATEGIES = {
+    "random": random_strategy,
+    "first": first_free_strategy,
+    "center": center_first_strategy,
+    "minimax": minimax_strategy,
+}
+
+
+class RemotePlayerError(Exception):
+    pass
+
+
+class RemotePlayer:
+    # Zdalny bot turniejowy - osobny protokół, klient gry z main.py go nie obsługuje.
+    # Na każdy ruch bot dostaje "BOARD|<9 znaków X/O/. wiersz po wierszu>|<znak>\n" i odpowiada "MOVE|r|c\n".
+    # Nie ma komunikatów o początku ani końcu partii. Każde zadanie (porcja partii) otwiera własne połączenie,
+    # więc bot musi obsłużyć do --workers połączeń jednocześnie.
+    def __init__(self, host, port, timeout=5.0):
+        self.buffer = ""
+        try:
+            self.sock = socket.create_connection((host, port), timeout=timeout)
+        except OSError as e:
+            print(f"[Turniej] Brak połączenia z {host}:{port}: {e}")
+            self.sock = None
+
+    def __call__(self, board, mark, rng):
+        # Po błędzie gracz jest martwy do końca zadania - spóźniona odpowiedź nie może trafić do kolejnej partii
+        if self.sock is None: raise RemotePlayerError("Zdalny gracz niedostępny")
+        try:
+            self.sock.sendall(f"BOARD|{_board_key(board)}|{mark}\n".encode())
+            while "\n" not in self.buffer:
+                data = self.sock.recv(BUFFER_SIZE)
+                if not data: raise ConnectionError("Połączenie zamknięte przez zdalnego gracza")
+                self.buffer += data.decode('utf-8', 'ignore')
+            line, self.buffer = self.buffer.split("\n", 1)
+            parts = line.strip().split("|")
+            if len(parts) != 3 or parts[0] != "MOVE": raise ValueError(f"Niepoprawna odpowiedź: '{line.strip()}'")
+            return int(parts[1]), int(parts[2])
+        except (OSError, ValueError) as e:
+            self.close()
+            raise RemotePlayerError(str(e)) from e
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+
+def validate_entrant(spec):
+    if spec in STRATEGIES: return
+    if spec.startswith(REMOTE_PREFIX):
+        host, _, port = spec[len(REMOTE_PREFIX):].rpartition(":")
+        if host and port.isdigit(): return
+    raise ValueError(f"Nieznany uczestnik: '{spec}' (dostępne: {', '.join(STRATEGIES)} lub remote:HOST:PORT)")
+
+
+def make_player(spec):
+    if spec in STRATEGIES: return STRATEGIES[spec]
+    host, _, port = spec[len(REMOTE_PREFIX):].rpartition(":")
+    return RemotePlayer(host, int(port))
+
+
+def play_game(player_x, player_o, rng):
+    # Zwraca "X", "O" albo None przy remisie; błąd lub niedozwolony ruch zdalnego gracza oznacza walkower,
+    # błędy wbudowanych strategii są propagowane
+    game = rules.HeadlessGame("X")
+    players = {"X": player_x, "O": player_o}
+    while not game.game_over:
+        mark = game.turn
+        player = players[mark]
+        try:
+            r, c = player(game.board, mark, rng)
+        except RemotePlayerError:
+            return rules.other_mark(mark)
+        if not game.make_move(r, c, mark):
+            if isinstance(player, RemotePlayer): return rules.other_mark(mark)
+            raise ValueError(f"Strategia zwróciła niedozwolony ruch: {r}, {c}")
+    return game.winner
+
+
+def play_match_chunk(spec_a, spec_b, games, first_game, seed):
+    # Uruchamiane w procesie roboczym; gracze zamieniają się znakami co partię, X zawsze zaczyna
+    rng = random.Random(seed)
+    player_a, player_b = make_player(spec_a), make_player(spec_b)
+    a_wins = b_wins = draws = 0
+    try:
+        for i in range(first_game, first_game + games):
+            a_is_x = i % 2 == 0
+            winner = play_game(player_a, player_b, rng) if a_is_x else play_game(player_b, player_a, rng)
+            if winner is None:
+                draws += 1
+            elif (winner == "X") == a_is_x:
+                a_wins += 1
+            else:
+                b_wins += 1
+    finally:
+        for player in (player_a, player_b):
+            if isinstance(player, RemotePlayer): player.close()
+    return a_wins, b_wins, draws
+
+
+class Standings:
+    def __init__(self, entrants):
+        self.records = {name: {"W": 0, "D": 0, "L": 0} for name in entrants}
+
+    def record(self, a, b, a_wins, b_wins, draws):
+        self.records[a]["W"] += a_wins; self.records[a]["L"] += b_wins; self.records[a]["D"] += draws
+        self.records[b]["W"] += b_wins; self.records[b]["L"] += a_wins; self.records[b]["D"] += draws
+
+    def points(self, name):
+        rec = self.records[name]
+        return rec["W"] + rec["D"] / 2
+
+    def table(self):
+        order = sorted(self.records, key=lambda n: (-self.points(n), -self.records[n]["W"]))
+        width = max([len(n) for n in order] + [9])
+        lines = [f"{'Uczestnik':<{width}} {'W':>9} {'R':>9} {'P':>9} {'Pkt':>11}"]
+        for name in order:
+            rec = self.records[name]
+            lines.append(f"{name:<{width}} {rec['W']:>9} {rec['D']:>9} {rec['L']:>9} {self.points(name):>11.1f}")
+        return "\n".join(lines)
+
+
+def _submit_match(executor, a, b, games, chunk_size, rng):
+    futures = {}
+    for first_game in range(0, games, chunk_size):
+        count = min(chunk_size, games - first_game)
+        future = executor.submit(play_match_chunk, a, b, count, first_game, rng.getrandbits(64))
+        futures[future] = (a, b)
+    return futures
+
+
+def run_round_robin(entrants, games, executor, chunk_size=DEFAULT_CHUNK_SIZE, seed=None, on_result=None):
+    rng = random.Random(seed)
+    standings = Standings(entrants)
+    futures = {}
+    for i, a in enumerate(entrants):
+        for b in entrants[i + 1:]:
+            futures.update(_submit_match(executor, a, b, games, chunk_size, rng))
+    for future in as_completed(futures):
+        a, b = futures[future]
+        standings.record(a, b, *future.result())
+        if on_result: on_result(standings)
+    return standings
+
+
+def run_bracket(entrants, games, executor, chunk_size=DEFAULT_CHUNK_SIZE, seed=None, on_result=None):
+    # Pojedyncza eliminacja z rozstawieniem według kolejności na liście (1 vs N, 2 vs N-1, ...);
+    # wolne losy dostają najwyżej rozstawieni, przy remisie w meczu awansuje uczestnik rozstawiony wyżej
+    rng = random.Random(seed)
+    standings = Standings(entrants)
+    seeds = {name: i for i, name in enumerate(entrants)}
+    order = [0]
+    while len(order) < len(entrants):
+        order = [s for i in order for s in (i, 2 * len(order) - 1 - i)]
+    current = [entrants[i] if i < len(entrants) else None for i in order]
+    rounds = []
+    while len(current) > 1:
+        pairs = [(current[i], current[i + 1]) for i in range(0, len(current), 2)]
+        scores = {}
+        futures = {}
+        for a, b in pairs:
+            if a is not None and b is not None:
+                scores[(a, b)] = [0, 0]
+                futures.update(_submit_match(executor, a, b, games, chunk_size, rng))
+        for future in as_completed(futures):
+            a, b = futures[future]
+            a_wins, b_wins, draws = future.result()
+            scores[(a, b)][0] += a_wins; scores[(a, b)][1] += b_wins
+            standings.record(a, b, a_wins, b_wins, draws)
+            if on_result: on_result(standings)
+        next_round = []
+        for a, b in pairs:
+            if a is None or b is None:
+                next_round.append(a if b is None else b)
+            else:
+                a_score, b_score = scores[(a, b)]
+                if a_score == b_score: next_round.append(a if seeds[a] < seeds[b] else b)
+                else: next_round.append(a if a_score > b_score else b)
+        rounds.append([(pair, winner) for pair, winner in zip(pairs, next_round) if winner is not None])
+        current = next_round
+    return standings, rounds, current[0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Turniej botów Kółko i Krzyżyk (bez GUI).")
+    parser.add_argument("entrants", nargs="+",
+                        help=f"Uczestnicy: {', '.join(STRATEGIES)} lub remote:HOST:PORT")
+    parser.add_argument("--mode", choices=["roundrobin", "bracket"], default="roundrobin")
+    parser.add_argument("--games", type=int, default=1000, help="Liczba partii w każdym meczu")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Liczba procesów roboczych")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Liczba partii na zadanie")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    if len(set(args.entrants)) != len(args.entrants): parser.error("Uczestnicy muszą być unikalni")
+    if len(args.entrants) < 2: parser.error("Potrzeba co najmniej dwóch uczestników")
+    if args.games < 1 or args.chunk_size < 1: parser.error("--games i --chunk-size muszą być dodatnie")
+    try:
+        for spec in args.entrants: validate_entrant(spec)
+    except ValueError as e:
+        parser.error(str(e))
+
+    progress = {"chunks": 0}
+
+    def on_result(standings):
+        progress["chunks"] += 1
+        if progress["chunks"] % 50 == 0: print(f"[Turniej] Ukończone zadania: {progress['chunks']}")
+
+    print(f"[Turniej] Tryb: {args.mode}, partie na mecz: {args.games}, procesy: {args.workers}")
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        if args.mode == "roundrobin":
+            standings = run_round_robin(args.entrants, args.games, executor, args.chunk_size, args.seed, on_result)
+        else:
+            standings, rounds, champion = run_bracket(args.entrants, args.games, executor, args.chunk_size,
+                                                      args.seed, on_result)
+            for number, matches in enumerate(rounds, 1):
+                for (a, b), winner in matches:
+                    print(f"[Turniej] Runda {number}: {a} vs {b or '(wolny los)'} -> {winner}")
+            print(f"[Turniej] Zwycięzca: {champion}")
+    elapsed = time.perf_counter() - start
+    total = sum(sum(rec.values()) for rec in standings.records.values()) // 2
+    print(standings.table())
+    print(f"[Turniej] Rozegrano {total} partii w {elapsed:.1f} s.")
+
+
+if __name__ == "__main__":
+    main()